@@ -1,4 +1,5 @@
 import os, warnings, errno
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from imageio import imread, imwrite
 import skimage.color as color
@@ -6,8 +7,107 @@ from skimage.transform import resize
 
 from .file_utils import get_nested_dirs, list_files
 
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
 VALID_EXTS = ('.jpg', '.jpeg', '.png', '.tif', '.tiff', '.bmp',)
 
+def _place_crops_in_strips(crop_imgs, width, place, n_jobs=1, executor=None):
+    """
+    Call place(section, r0, c0) for the part of each crop inside each of n_jobs
+    disjoint column strips of an image of the given width, where (r0, c0) is the
+    position of section in the image. Strips never share output pixels, so with
+    n_jobs > 1 they are run on the threads of the given executor.
+    """
+
+    col_lefts = np.array([crop['corner'][1] for crop in crop_imgs], dtype=np.int64)
+    col_rights = col_lefts + [crop['img'].shape[1] for crop in crop_imgs]
+
+    def _place_strip(strip):
+        # only visit the crops that reach into this strip
+        for i in np.flatnonzero((col_lefts < strip[1]) & (col_rights > strip[0])):
+            r0, c0 = crop_imgs[i]['corner']
+            lo = max(c0, strip[0])
+            hi = min(c0 + crop_imgs[i]['img'].shape[1], strip[1])
+            place(crop_imgs[i]['img'][:, lo - c0:hi - c0], r0, lo)
+
+    edges = np.linspace(0, width, max(n_jobs, 1) + 1).astype(int)
+    strips = list(zip(edges[:-1].tolist(), edges[1:].tolist()))
+    if len(strips) == 1 or executor is None:
+        for strip in strips:
+            _place_strip(strip)
+    else:
+        list(executor.map(_place_strip, strips))
+
+def _crop_layout(corners, sizes):
+    """
+    Describe how crops with the given (N, 2) corners and sizes are laid out.
+    Returns the dimensions of the stitched image, the sorted distinct row and
+    column offsets of the crops, and whether the crops are equally sized with no
+    repeated corner.
+    """
+
+    img_dims = tuple((corners + sizes).max(axis=0).tolist())
+    row_tops = np.unique(corners[:, 0])
+    col_lefts = np.unique(corners[:, 1])
+    uniform = ((sizes == sizes[0]).all()
+               and len(np.unique(corners, axis=0)) == len(corners))
+    return img_dims, row_tops, col_lefts, uniform
+
+def _stitch_crops_vips(crop_imgs):
+    """
+    Assemble crops holding pyvips images into one lazy pyvips image. Overlapping
+    regions are not blended; each pixel is taken from one of the crops covering
+    it. Complete grids of equally sized crops (e.g. from grid_crop) are joined in
+    a single arrayjoin; other layouts fall back to inserting crops one by one.
+    """
+
+    corners = np.array([crop['corner'] for crop in crop_imgs], dtype=np.int64)
+    sizes = np.array([(crop['img'].height, crop['img'].width) for crop in crop_imgs],
+                     dtype=np.int64)
+    img_dims, row_tops, col_lefts, uniform = _crop_layout(corners, sizes)
+
+    if (uniform and len(corners) == len(row_tops) * len(col_lefts)
+            and row_tops[0] == 0 and col_lefts[0] == 0):
+        # cut the image into cells one stride apart (the last ones may be
+        # smaller) and take each cell from the last crop starting at or before
+        # it, which trims overlapping edge crops down to the part they add
+        crop_size = sizes[0]
+        stride = [np.diff(row_tops)[0] if len(row_tops) > 1 else crop_size[0],
+                  np.diff(col_lefts)[0] if len(col_lefts) > 1 else crop_size[1]]
+        cell_tops = np.arange(0, img_dims[0], stride[0])
+        cell_lefts = np.arange(0, img_dims[1], stride[1])
+        cell_bottoms = np.minimum(cell_tops + stride[0], img_dims[0])
+        cell_rights = np.minimum(cell_lefts + stride[1], img_dims[1])
+        src_tops = row_tops[np.searchsorted(row_tops, cell_tops, side='right') - 1]
+        src_lefts = col_lefts[np.searchsorted(col_lefts, cell_lefts, side='right') - 1]
+
+        if ((src_tops + crop_size[0] >= cell_bottoms).all()
+                and (src_lefts + crop_size[1] >= cell_rights).all()):
+            crops_by_corner = {tuple(corner): crop['img'] 
+                               for corner, crop in zip(corners.tolist(), crop_imgs)}
+            rows = list(zip(cell_tops.tolist(), cell_bottoms.tolist(), 
+                            src_tops.tolist()))
+            cols = list(zip(cell_lefts.tolist(), cell_rights.tolist(), 
+                            src_lefts.tolist()))
+            cells = [crops_by_corner[(r0, c0)].crop(left - c0, top - r0, 
+                                                    right - left, bottom - top)
+                     for top, bottom, r0 in rows
+                     for left, right, c0 in cols]
+            img = pyvips.Image.arrayjoin(cells, across=len(cols), 
+                                         hspacing=int(stride[1]), 
+                                         vspacing=int(stride[0]))
+            return img.crop(0, 0, img_dims[1], img_dims[0])
+
+    first = crop_imgs[0]['img']
+    img = pyvips.Image.black(img_dims[1], img_dims[0], bands=first.bands)
+    img = img.cast(first.format)
+    for crop in sorted(crop_imgs, key=lambda x: tuple(x['corner'])):
+        img = img.insert(crop['img'], int(crop['corner'][1]), int(crop['corner'][0]))
+    return img
+
 def grid_crop(img, crop_dims, stride_size=None, include_excess=True):
     """
     Split the image into tiles of smaller images.
@@ -18,14 +118,18 @@ def grid_crop(img, crop_dims, stride_size=None, include_excess=True):
     behavior can be overridden by setting 'include_excess' to False.
 
     Inputs:
-        img - Numpy-like image.
-        crop_dims - The dimensions of each cropped image.
+        img - Numpy-like image (e.g. a numpy array or PIL image), or a 
+              pyvips.Image. For pyvips images the crops are lazy pyvips regions,
+              so pixels are only read when used.
+        crop_dims - The dimensions of each cropped image. Must not exceed the
+                    image dimensions.
         stride_size - The offset between each cropped image, in pixels. (Default: 
                     crop_dims)
         include_excess - When true, includes extra crops to include edges that would
                          exceed the largest multiple of crop_dims within the image.
     Outputs:
-        crop_imgs - List of crop dicts containing img and other keys.
+        crop_imgs - List of crop dicts containing img and other keys. Each img is 
+                    a view sharing memory with the source array, not a copy.
     """
 
     def _grid_crop_corners(im_dims, crop_size, stride_size=None, include_excess=True):
@@ -35,44 +139,53 @@ def grid_crop(img, crop_dims, stride_size=None, include_excess=True):
         assert(len(crop_size) == 2 
                and len(stride_size) == 2)
 
-        r_indices = range(0, im_dims[0] - crop_size[0], stride_size[0])
-        c_indices = range(0, im_dims[1] - crop_size[1], stride_size[1])
-        if include_excess:
-            r_indices.append(im_dims[0] - crop_size[0])
-            c_indices.append(im_dims[1] - crop_size[1])
-
-        crop_corners = []
-        crop_ctr = 0
-        for r in r_indices:
-            for c in c_indices:
-                crop_corners.append((r, c))
-        return crop_corners
+        if im_dims[0] < crop_size[0] or im_dims[1] < crop_size[1]:
+            raise ValueError('Image dimensions {} are smaller than crop_dims {}.'.format(
+                tuple(im_dims[:2]), tuple(crop_size)))
 
+        r_last = im_dims[0] - crop_size[0]
+        c_last = im_dims[1] - crop_size[1]
+        r_indices = np.arange(0, r_last + 1, stride_size[0], dtype=np.int32)
+        c_indices = np.arange(0, c_last + 1, stride_size[1], dtype=np.int32)
+        if include_excess:
+            if r_indices[-1] != r_last:
+                r_indices = np.r_[r_indices, r_last].astype(np.int32)
+            if c_indices[-1] != c_last:
+                c_indices = np.r_[c_indices, c_last].astype(np.int32)
+
+        # (N, 2) array of (row, col) corners in row-major order
+        rr, cc = np.meshgrid(r_indices, c_indices, indexing='ij')
+        return np.stack([rr.ravel(), cc.ravel()], axis=1)
+
+    if pyvips is not None and isinstance(img, pyvips.Image):
+        img_dims = (img.height, img.width)
+        crop_corners = _grid_crop_corners(img_dims, crop_dims, stride_size, 
+                                          include_excess)
+        return [{'img': img.crop(corner[1], corner[0], crop_dims[1], crop_dims[0]),
+                 'corner': tuple(corner)}
+                for corner in crop_corners.tolist()]
+
+    # convert once (e.g. from a PIL image); crops are then views into this array
+    img = np.asarray(img)
     img_dims = img.shape # NOTE: (rows, cols)
     crop_corners = _grid_crop_corners(img_dims, crop_dims, stride_size, include_excess)
 
-    # loop through crop_corners and create crop for each
-    crop_imgs = []
-    for corner in crop_corners:
-        idxs = (corner[0], corner[0] + crop_dims[0],
-                corner[1], corner[1] + crop_dims[1])
-        try:
-            crop_img = img[idxs[0]:idxs[1], idxs[2]:idxs[3], :]
-        except IndexError:
-            crop_img = img[idxs[0]:idxs[1], idxs[2]:idxs[3]]
-        crop = {'img': crop_img,
-                'corner': corner}
-        crop_imgs.append(crop)
+    # slice the crop at each corner; every crop is a view into img
+    crop_imgs = [{'img': img[r:r + crop_dims[0], c:c + crop_dims[1]],
+                  'corner': (r, c)}
+                 for r, c in crop_corners.tolist()]
 
     return crop_imgs
 
-def stitch_crops(crop_imgs, method='linear_average', method_args={}):
+def stitch_crops(crop_imgs, method='linear_average', method_args={}, n_jobs=1):
     """
     Merge a list of regularly-spaced cropped images into one single image.
 
     Inputs:
         crop_imgs - List of crop dicts containing the following keys:
-            'img' - Numpy array with image.
+            'img' - Numpy array with image. If every crop holds a pyvips.Image, 
+                    they are assembled into a lazy pyvips.Image instead, 
+                    without blending overlaps (method is ignored).
             'corner' - Tuple specifying the location of the upper-left
                        corner of the image.
         method - Blend method to combine two images. Options are:
@@ -86,8 +199,12 @@ def stitch_crops(crop_imgs, method='linear_average', method_args={}):
         method_args - Dict containing keyword args to use with method. Options are:
             'sigmoid_average':
                 'k' - Sets spread of sigmoid function along x-axis. (Default: 12)
+        n_jobs - Number of threads used to place crops. Used by the 'average', 'max',
+                 and bitwise methods, and by every method when no two crops
+                 overlap (the crops are then copied into place). (Default: 1)
     Outputs:
-        img - Numpy array with stitched image.
+        img - Numpy array with stitched image, with the same data type as the 
+              crops.
     """
 
     def _stitch_row(crop_row, method, method_args={}):
@@ -103,6 +220,10 @@ def stitch_crops(crop_imgs, method='linear_average', method_args={}):
         else: 
             row_img = np.zeros((row_img_shape[0], row_img_shape[1], n_channels), dtype=np.float64)
 
+        # a lone crop has nothing to blend with
+        if len(crop_row) == 1:
+            row_img[:, crop_row[0]['corner'][1]:] = crop_row[0]['img']
+
         prev_width = 0
         for i in range(len(crop_row) - 1):
             # create overlap_img
@@ -113,6 +234,7 @@ def stitch_crops(crop_imgs, method='linear_average', method_args={}):
                 crop1['corner'][1] + crop1['img'].shape[1]
             ]
             overlap_width = overlap[1] - overlap[0]
+            crop1_width = crop1['img'].shape[1]
 
             x_vec = np.linspace(0, 1, overlap_width)
             if method == 'linear_average':
@@ -133,12 +255,13 @@ def stitch_crops(crop_imgs, method='linear_average', method_args={}):
                 weights = weights[None, :, None]
 
             overlap_img = (weights * crop2['img'][:, 0:overlap_width] 
-                         + weights[:, ::-1] * crop1['img'][:, -overlap_width:])
+                         + weights[:, ::-1] * crop1['img'][:, crop1_width - overlap_width:])
 
             # blend images into row_img
             crop1_rng = (crop1['corner'][1] + prev_width, overlap[0])
             crop2_rng = (overlap[1], crop2['corner'][1] + crop2['img'].shape[1])
-            row_img[:, crop1_rng[0]:crop1_rng[1]] = crop1['img'][:, prev_width:-overlap_width]
+            row_img[:, crop1_rng[0]:crop1_rng[1]] = \
+                crop1['img'][:, prev_width:crop1_width - overlap_width]
             row_img[:, crop2_rng[0]:crop2_rng[1]] = crop2['img'][:, overlap_width:]
             row_img[:, overlap[0]:overlap[1]] = overlap_img
             prev_width = overlap_width
@@ -149,6 +272,13 @@ def stitch_crops(crop_imgs, method='linear_average', method_args={}):
         ]
         return row_img, span
 
+    if pyvips is not None and all(isinstance(crop['img'], pyvips.Image) 
+                                  for crop in crop_imgs):
+        return _stitch_crops_vips(crop_imgs)
+
+    # convert each crop to a numpy array once, without modifying the caller's dicts
+    crop_imgs = [dict(crop, img=np.asarray(crop['img'])) for crop in crop_imgs]
+
     # determine type and number of channel of crops
     mode = crop_imgs[0]['img'].dtype
     try:
@@ -157,135 +287,194 @@ def stitch_crops(crop_imgs, method='linear_average', method_args={}):
         n_channels = 1
 
     # check that all crops have same number of channels
-    for crop in crop_imgs:
-        try:
-            crop_n_channel = crop['img'].shape[2]
-        except IndexError:
-            crop_n_channel = 1
-
-        if crop_n_channel != n_channels:
-            raise Exception("Number of channels is not consistent between images.")
+    channel_counts = {crop['img'].shape[2:3] for crop in crop_imgs}
+    if len(channel_counts) > 1:
+        raise Exception("Number of channels is not consistent between images.")
 
     # check that all crops are of same type
-    for crop in crop_imgs:
-        if crop['img'].dtype != mode:
-            warnings.warn("Data types of images are not consistent. May produce \
-                           unpredictable results.")
-            break
-
-    # find dimensions of original image
-    max_dims = [0, 0]
-    max_corner = [0, 0]
-    for crop in crop_imgs:
-        if crop['img'].shape[0] > max_dims[0]:
-            max_dims[0] = crop['img'].shape[0]
-
-        if crop['img'].shape[1] > max_dims[1]:
-            max_dims[1] = crop['img'].shape[1]
-
-        if crop['corner'][0] > max_corner[0]:
-            max_corner[0] = crop['corner'][0]
-
-        if crop['corner'][1] > max_corner[1]:
-            max_corner[1] = crop['corner'][1]
-    img_dims = (max_corner[0] + max_dims[0], max_corner[1] + max_dims[1])
-
-    # create numpy array to hold crops
+    if len({crop['img'].dtype for crop in crop_imgs}) > 1:
+        warnings.warn("Data types of images are not consistent. May produce "
+                      "unpredictable results.")
+
+    # sort crops by corner position so that each row of crops is contiguous
+    crop_imgs = sorted(crop_imgs, key=lambda x: x['corner'][0])
+
+    # find dimensions of original image from the furthest crop extent
+    corners = np.array([crop['corner'] for crop in crop_imgs], dtype=np.int64)
+    sizes = np.array([crop['img'].shape[:2] for crop in crop_imgs], dtype=np.int64)
+    if (corners < 0).any():
+        raise ValueError('Crop corners must be non-negative.')
+    img_dims, row_tops, col_lefts, uniform = _crop_layout(corners, sizes)
+
+    # create numpy array to hold crops, in the same data type as the crops
     try:
         if n_channels == 1:
-            img = np.zeros((img_dims[0], img_dims[1]), dtype=int)
+            img = np.zeros((img_dims[0], img_dims[1]), dtype=mode)
         else:
-            img = np.zeros((img_dims[0], img_dims[1], n_channels), dtype=int)
+            img = np.zeros((img_dims[0], img_dims[1], n_channels), dtype=mode)
     except MemoryError:
         raise MemoryError('Failed to create image with dimensions [{}, {}, {}]'.format(
             img_dims[0], img_dims[1], n_channels))
 
-    # stitch image into numpy array
-    if method == 'linear_average' or method == 'sigmoid_average':
-        # sort crops by corner position
-        crop_imgs = sorted(crop_imgs, key=lambda x: x['corner'][0])
-        unique_row_idxs, crop_idxs = np.unique(
-            [i['corner'][0] for i in crop_imgs], 
-            return_index=True
-        )
-
-        # group crops into rows by corner position
-        n_rows = len(unique_row_idxs)
-        crop_rows = []
-        for i in range(n_rows):
-            i_first = crop_idxs[i]
-            if i + 1 < n_rows:
-                i_last = crop_idxs[i + 1]
-                crop_rows.append(crop_imgs[i_first:i_last])
-            else:
-                crop_rows.append(crop_imgs[i_first:])
+    # look up the blend method once; unknown methods fall back to 'average'
+    blend_ufuncs = {'or': np.bitwise_or,
+                    'and': np.bitwise_and,
+                    'xor': np.bitwise_xor,
+                    'max': np.maximum,
+                    'maximum': np.maximum}
+    if method not in blend_ufuncs and method not in ('average', 'linear_average',
+                                                     'sigmoid_average'):
+        warnings.warn("Invalid method: '%s'. Reverting to 'average'." 
+                      % method, UserWarning)
+        method = 'average'
+
+    # equally sized crops whose distinct rows and columns are at least one crop
+    # apart cannot overlap, so every method reduces to copying them into place
+    disjoint = (uniform
+                and (np.diff(row_tops) >= sizes[0, 0]).all()
+                and (np.diff(col_lefts) >= sizes[0, 1]).all())
+
+    # stitch image into numpy array, sharing one pool of strip threads between
+    # every placement pass below
+    with ThreadPoolExecutor(max(n_jobs, 1)) as executor:
+        if disjoint:
+            def _copy_section(section, r0, c0):
+                np.copyto(img[r0:r0 + section.shape[0], c0:c0 + section.shape[1]], section)
+
+            _place_crops_in_strips(crop_imgs, img_dims[1], _copy_section, n_jobs, executor)
+        elif method == 'linear_average' or method == 'sigmoid_average':
+            unique_row_idxs, crop_idxs = np.unique(
+                [i['corner'][0] for i in crop_imgs], 
+                return_index=True
+            )
+
+            # group crops into rows by corner position
+            n_rows = len(unique_row_idxs)
+            crop_rows = []
+            for i in range(n_rows):
+                i_first = crop_idxs[i]
+                if i + 1 < n_rows:
+                    i_last = crop_idxs[i + 1]
+                    crop_rows.append(crop_imgs[i_first:i_last])
+                else:
+                    crop_rows.append(crop_imgs[i_first:])
             
-        # fuse images, first by column, then by row
-        prev_ht = 0
-        for i in range(n_rows - 1):
-            # get row imgs
-            crop_row1 = crop_rows[i]
-            crop_row2 = crop_rows[i + 1]
-            row_img1, span1 = _stitch_row(crop_row1, method, method_args)
-            row_img2, span2 = _stitch_row(crop_row2, method, method_args)
-
-            # create overlap_img
-            overlap = [span2[0], span1[1]]
-            overlap_ht = overlap[1] - overlap[0]
-
-            x_vec = np.linspace(0, 1, overlap_ht)
-            if method == 'linear_average':
-                weights = x_vec
-            elif method == 'sigmoid_average':
-                try:
-                    k = method_args['k']
-                except KeyError:
-                    k = 12
-                weights = 1.0 / (1.0 + np.exp(-k * (x_vec - 0.5)))
-            else:
-                weights = x_vec
-
-            if n_channels == 1:
-                weights = weights[:, None]
-            else:
-                weights = weights[:, None, None]
-
-            overlap_img = (weights * row_img2[0:overlap_ht]
-                         + weights[::-1] * row_img1[-overlap_ht:])
-
-            # blend images into img
-            row1_rng = [span1[0] + prev_ht, span2[0]]
-            row2_rng = [span1[1], span2[1]]
-            img[row1_rng[0]:row1_rng[1]] = row_img1[prev_ht:-overlap_ht]
-            img[row2_rng[0]:row2_rng[1]] = row_img2[overlap_ht:]
-            img[overlap[0]:overlap[1]] = overlap_img
-            prev_ht = overlap_ht
-    else:
-        for crop in crop_imgs:
-            idxs = (crop['corner'][0], crop['corner'][0] + crop['img'].shape[0], 
-                    crop['corner'][1], crop['corner'][1] + crop['img'].shape[1])
-            img_section = img[idxs[0]:idxs[1], idxs[2]:idxs[3], :]
-
-            if len(crop['img'].shape) < 3:
-                crop['img'] = np.expand_dims(crop['img'], 2)
-
-            # blend method
-            if method == 'or':
-                crop_merged = np.bitwise_or(img_section, crop['img'])
-            elif method == 'and':
-                crop_merged = np.bitwise_and(img_section, crop['img'])
-            elif method == 'xor':
-                crop_merged = np.bitwise_xor(img_section, crop['img'])
-            elif method == 'average':
-                crop_merged = (img_section + crop['img']) / 2.0
-            elif method == 'max' or method == 'maximum':
-                crop_merged = np.maximum(img_section, crop['img'])
-            else:
-                warnings.warn("Invalid method: '%s'. Reverting to 'average'." 
-                              % method, UserWarning)
-                crop_merged = (img_section + crop['img']) / 2.0
-
-            img[idxs[0]:idxs[1], idxs[2]:idxs[3], :] = crop_merged
+            # a lone row of crops has nothing to blend with
+            if n_rows == 1:
+                row_img, span = _stitch_row(crop_rows[0], method, method_args)
+                if not np.issubdtype(img.dtype, np.floating):
+                    np.rint(row_img, out=row_img)
+                img[span[0]:span[1]] = row_img
+
+            # fuse images, first by column, then by row
+            prev_ht = 0
+            for i in range(n_rows - 1):
+                # get row imgs
+                crop_row1 = crop_rows[i]
+                crop_row2 = crop_rows[i + 1]
+                row_img1, span1 = _stitch_row(crop_row1, method, method_args)
+                row_img2, span2 = _stitch_row(crop_row2, method, method_args)
+
+                # create overlap_img
+                overlap = [span2[0], span1[1]]
+                overlap_ht = overlap[1] - overlap[0]
+                row1_ht = row_img1.shape[0]
+
+                x_vec = np.linspace(0, 1, overlap_ht)
+                if method == 'linear_average':
+                    weights = x_vec
+                elif method == 'sigmoid_average':
+                    try:
+                        k = method_args['k']
+                    except KeyError:
+                        k = 12
+                    weights = 1.0 / (1.0 + np.exp(-k * (x_vec - 0.5)))
+                else:
+                    weights = x_vec
+
+                if n_channels == 1:
+                    weights = weights[:, None]
+                else:
+                    weights = weights[:, None, None]
+
+                overlap_img = (weights * row_img2[0:overlap_ht]
+                             + weights[::-1] * row_img1[row1_ht - overlap_ht:])
+
+                # round blended values rather than truncate them into integer types
+                if not np.issubdtype(img.dtype, np.floating):
+                    for blended in (row_img1, row_img2, overlap_img):
+                        np.rint(blended, out=blended)
+
+                # blend images into img
+                row1_rng = [span1[0] + prev_ht, span2[0]]
+                row2_rng = [span1[1], span2[1]]
+                img[row1_rng[0]:row1_rng[1]] = row_img1[prev_ht:row1_ht - overlap_ht]
+                img[row2_rng[0]:row2_rng[1]] = row_img2[overlap_ht:]
+                img[overlap[0]:overlap[1]] = overlap_img
+                prev_ht = overlap_ht
+        elif method in blend_ufuncs:
+            if method == 'and':
+                # set all bits where any crop lands so the first crop over a pixel is
+                # kept; pixels no crop covers stay 0 as on the other paths
+                all_set = ~np.zeros((), dtype=img.dtype)
+
+                def _set_section(section, r0, c0):
+                    img[r0:r0 + section.shape[0], c0:c0 + section.shape[1]] = all_set
+
+                _place_crops_in_strips(crop_imgs, img_dims[1], _set_section, n_jobs, executor)
+
+            blend = blend_ufuncs[method]
+
+            def _blend_section(section, r0, c0):
+                img_section = img[r0:r0 + section.shape[0], c0:c0 + section.shape[1]]
+                blend(img_section, section, out=img_section)
+
+            _place_crops_in_strips(crop_imgs, img_dims[1], _blend_section, n_jobs, executor)
+        else:
+            # sum crops and count overlaps, then divide once so that every crop
+            # covering a pixel is weighted equally. Crops are accumulated one row
+            # at a time into a band as tall as the tallest crop; once the next row
+            # of crops starts, the band rows above it are complete and written out.
+            row_tops, row_starts = np.unique(corners[:, 0], return_index=True)
+            row_tops = np.append(row_tops, img_dims[0])
+            row_starts = np.append(row_starts, len(crop_imgs))
+
+            # float32 is exact for 8- and 16-bit crops; wider types need float64
+            band_ht = int(sizes[:, 0].max())
+            acc = np.zeros((band_ht,) + img.shape[1:],
+                           dtype=np.promote_types(mode, np.float32))
+            cnt = np.zeros(acc.shape[:2], dtype=np.uint16)
+            cnt_bcast = cnt.reshape(cnt.shape + (1,) * (acc.ndim - 2))
+            band_top = 0
+            for i in range(len(row_tops)):
+                # write out band rows that no remaining crop overlaps
+                n_done = min(row_tops[i] - band_top, band_ht)
+                done_acc = acc[:n_done]
+                done_cnt = cnt_bcast[:n_done]
+                np.maximum(done_cnt, 1, out=done_cnt)
+                np.divide(done_acc, done_cnt, out=done_acc)
+                if not np.issubdtype(img.dtype, np.floating):
+                    np.rint(done_acc, out=done_acc)
+                img[band_top:band_top + n_done] = done_acc
+
+                # shift the rest of the band up to start at this row of crops
+                acc[:band_ht - n_done] = acc[n_done:]
+                cnt[:band_ht - n_done] = cnt[n_done:]
+                acc[band_ht - n_done:] = 0
+                cnt[band_ht - n_done:] = 0
+                band_top = row_tops[i]
+
+                if i + 1 == len(row_tops):
+                    break
+
+                def _accumulate_section(section, r0, c0):
+                    idxs = (r0 - band_top, r0 - band_top + section.shape[0],
+                            c0, c0 + section.shape[1])
+                    acc[idxs[0]:idxs[1], idxs[2]:idxs[3]] += section
+                    cnt[idxs[0]:idxs[1], idxs[2]:idxs[3]] += 1
+
+                _place_crops_in_strips(crop_imgs[row_starts[i]:row_starts[i + 1]],
+                                       img_dims[1], _accumulate_section, n_jobs, executor)
 
     return img
 
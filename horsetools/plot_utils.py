@@ -3,14 +3,15 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
 def scatter_3d(X, sample_size=None, fig=None, subplot=None, title='X', xlabel='X', 
-               ylabel='Y', zlabel='Z'):
+               ylabel='Y', zlabel='Z', rasterized=False, pixel_threshold=10000):
     """
     Create 3d scatterplot of N-by-3 array.
 
     Inputs:
         x - The N-by-3 array to visualize.
         sample_size - The number of samples to select from x. If None, the whole 
-            array X is used. Useful if N of X is very large. (Default: None)
+            array X is used. Useful if N of X is very large; drawing more than
+            ~1e5 points without it is very slow. (Default: None)
         fig - The Matplotlib figure to display the plot. If None, a new figure is
             created. (Default: None)
         subplot - The subplot positions consumed by Figure.add_subplot. If None, no
@@ -19,6 +20,11 @@ def scatter_3d(X, sample_size=None, fig=None, subplot=None, title='X', xlabel='X
         xlabel - The label applied to the x-axis.
         ylabel - The label applied to the y-axis.
         zlabel - The label applied to the z-axis.
+        rasterized - If True, the points are rasterized when saved to vector 
+            formats such as PDF or SVG. (Default: False)
+        pixel_threshold - If more than this many points are drawn, they are 
+            plotted as single-pixel markers with Axes.plot, which is much faster
+            than Axes.scatter. (Default: 10000)
     Outputs:
         x - The subsampled array.
     """
@@ -44,10 +50,14 @@ def scatter_3d(X, sample_size=None, fig=None, subplot=None, title='X', xlabel='X
         else:
             ax = fig.add_subplot(subplot, projection='3d')
            
-    if sample_size is not None:
+    if sample_size is not None and sample_size < X.shape[0]:
         X = subsample(X, sample_size)
         
-    ax.scatter(X[:, 0], X[:, 1], X[:, 2])
+    if X.shape[0] > pixel_threshold:
+        ax.plot(X[:, 0], X[:, 1], X[:, 2], linestyle='None', marker=',', 
+                rasterized=rasterized)
+    else:
+        ax.scatter(X[:, 0], X[:, 1], X[:, 2], rasterized=rasterized)
     ax.set_title(title)
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
@@ -65,15 +75,19 @@ def grid_imshow(grid, imgs_list, imgs2_list):
         imgs2_list - The second list of images to plot. Must be the same length as
             imgs_list.
     Outputs:
-        None
+        axes - The 2*grid[0]-by-grid[1] array of Matplotlib axes.
     """
 
+    # create every subplot at once rather than looking each one up per image
+    fig, axes = plt.subplots(2 * grid[0], grid[1], squeeze=False)
+
     for r in range(grid[0]):
         for c in range(grid[1]):
-            img = imgs_list[grid[1] * r + c]
-            img2 = imgs2_list[grid[1] * r + c]
+            idx = grid[1] * r + c
+            axes[2 * r, c].imshow(imgs_list[idx])
+            axes[2 * r + 1, c].imshow(imgs2_list[idx])
+
+    for ax in axes.ravel():
+        ax.set_axis_off()
 
-            plt.subplot(2 * grid[0], grid[1], 2 * r * grid[1] + c + 1)
-            plt.imshow(img)
-            plt.subplot(2 * grid[0], grid[1], (2 * r + 1) * grid[1] + c + 1)
-            plt.imshow(img2)
+    return axes